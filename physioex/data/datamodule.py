@@ -2,6 +2,7 @@ import os
 from typing import Callable, List, Union
 
 import pytorch_lightning as pl
+import torch
 from torch.utils.data import DataLoader, DistributedSampler, Subset, SubsetRandomSampler
 
 from physioex.data.dataset import PhysioExDataset
@@ -21,11 +22,24 @@ class PhysioExDataModule(pl.LightningDataModule):
         data_folder: str = None,
         num_nodes: int = 1,
         num_workers: int = os.cpu_count(),
+        pin_memory: bool = torch.cuda.is_available(),
+        prefetch_factor: int = None,
+        persistent_workers: bool = True,
     ):
         super().__init__()
 
+        if num_workers == 0 and prefetch_factor is not None:
+            raise ValueError(
+                "ERR: prefetch_factor can be set only when num_workers is greater than 0"
+            )
+
         self.datasets_id = datasets
         self.num_workers = num_workers
+        self.prefetch_factor = prefetch_factor
+        # keep the workers alive across epochs and validation rounds
+        self.persistent_workers = persistent_workers and num_workers > 0
+        # page-locked batches let lightning copy them to the gpu asynchronously
+        self.pin_memory = pin_memory
 
         if isinstance(datasets, list):
             self.dataset = PhysioExDataset(
@@ -55,6 +69,8 @@ class PhysioExDataModule(pl.LightningDataModule):
                 self.dataset.split(fold, i)
 
         train_idx, valid_idx, test_idx = self.dataset.get_sets()
+        self.num_train_samples = len(train_idx)
+        self.test_idx = test_idx
 
         if not self.hpc:
             self.train_dataset = self.dataset
@@ -73,6 +89,25 @@ class PhysioExDataModule(pl.LightningDataModule):
             self.valid_sampler = self.valid_dataset
             self.test_sampler = self.test_dataset
 
+    def set_active_dataset(self, dataset: str = None):
+        """
+        Restricts the test split to the samples of a single dataset, without reloading the data.
+
+        Args:
+            dataset (str): The name of the dataset to test on. If None, the test split covers all the datasets.
+        """
+        test_idx = self.test_idx
+
+        if dataset is not None:
+            dataset_idx = self.dataset.datasets.index(dataset)
+            test_idx = test_idx[self.dataset.dataset_idx[test_idx] == dataset_idx]
+
+        if not self.hpc:
+            self.test_sampler = SubsetRandomSampler(test_idx)
+        else:
+            self.test_dataset = Subset(self.dataset, test_idx)
+            self.test_sampler = self.test_dataset
+
     def train_dataloader(self):
         """
         Returns the DataLoader for the training dataset.
@@ -89,6 +124,9 @@ class PhysioExDataModule(pl.LightningDataModule):
                 else self.train_sampler
             ),
             num_workers=self.num_workers,
+            pin_memory=self.pin_memory,
+            prefetch_factor=self.prefetch_factor,
+            persistent_workers=self.persistent_workers,
         )
 
     def val_dataloader(self):
@@ -102,6 +140,9 @@ class PhysioExDataModule(pl.LightningDataModule):
                 else self.valid_sampler
             ),
             num_workers=self.num_workers,
+            pin_memory=self.pin_memory,
+            prefetch_factor=self.prefetch_factor,
+            persistent_workers=self.persistent_workers,
         )
 
     def test_dataloader(self):
@@ -112,4 +153,7 @@ class PhysioExDataModule(pl.LightningDataModule):
                 DistributedSampler(self.test_sampler) if self.hpc else self.test_sampler
             ),
             num_workers=self.num_workers,
+            pin_memory=self.pin_memory,
+            prefetch_factor=self.prefetch_factor,
+            persistent_workers=self.persistent_workers,
         )
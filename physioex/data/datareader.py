@@ -101,12 +101,17 @@ class MemmapReader(Reader):
 
             remainer = self.L - X.shape[0]
             # add zeros to the end of the array
-            X = np.concatenate([X, np.zeros((remainer, *X.shape[1:]))], axis=0)
+            X = np.concatenate(
+                [X, np.zeros((remainer, *X.shape[1:]), dtype=np.float32)], axis=0
+            )
 
         else:
             X = X[relative_id : relative_id + self.L, self.channels_index]
 
-        X = (torch.tensor(X).float() - self.mean) / self.std
+        # the channel indexing already returns a copy: wrap it without copying
+        # again and standardize it in place
+        X = torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32))
+        X.sub_(self.mean).div_(self.std)
 
         return X
 
@@ -240,7 +245,8 @@ class H5Reader(Reader):
             ][()]
             y = file["labels"][str(subject_id)][relative_id : relative_id + self.L][()]
 
-        X = (torch.tensor(X).float() - self.mean) / self.std
+        X = torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32))
+        X.sub_(self.mean).div_(self.std)
         y = torch.tensor(y).long()
 
         return X, y
@@ -334,7 +340,6 @@ def build_index(nums_windows, subjects_ids, sequence_length):
         start_index += num_sequences
 
     windows_index = np.zeros(np.max(subjects_ids) + 1, dtype=np.uint16)
-    for i, num_windows in enumerate(nums_windows):
-        windows_index[subjects_ids[i]] = num_windows
+    windows_index[subjects_ids] = nums_windows
 
     return subject_idx, relative_idx, windows_index
@@ -30,7 +30,6 @@ class PhysioExDataset(torch.utils.data.Dataset):
 
         self.readers = []
         self.tables = []
-        self.dataset_idx = []
 
         offset = 0
         for i, dataset in enumerate(datasets):
@@ -46,12 +45,14 @@ class PhysioExDataset(torch.utils.data.Dataset):
             )
             offset += len(reader)
 
-            self.dataset_idx += list(np.ones(len(reader)) * i)
-
             self.tables.append(reader.get_table())
             self.readers += [reader]
 
-        self.dataset_idx = np.array(self.dataset_idx, dtype=np.uint8)
+        # map each sample to its dataset with a single allocation
+        self.dataset_idx = np.repeat(
+            np.arange(len(self.readers), dtype=np.uint8),
+            [len(reader) for reader in self.readers],
+        )
         # set the table fold to the 0 fold by default
         self.split()
         self.target_transform = target_transform
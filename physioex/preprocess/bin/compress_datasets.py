@@ -1,5 +1,7 @@
 import argparse
+import math
 import os
+from itertools import islice
 from pathlib import Path
 
 import h5py
@@ -8,31 +10,47 @@ import pandas as pd
 from joblib import Parallel, delayed
 from tqdm import tqdm
 
+try:
+    from itertools import batched
+except ImportError:  # python < 3.12
+
+    def batched(iterable, n):
+        iterator = iter(iterable)
+        while batch := tuple(islice(iterator, n)):
+            yield batch
+
 
 def read_subject_record(data_folder, dataset_name, subject, num_windows, n_channels):
     subject = str(subject)
 
-    # the values are stored as numpy memmaps
-    raw = np.memmap(
-        os.path.join(data_folder, dataset_name, "raw", f"{subject}.npy"),
-        dtype="float32",
-        mode="r",
-        shape=(num_windows, n_channels, 3000),
-    )[:]
-
-    xsleep = np.memmap(
-        os.path.join(data_folder, dataset_name, "xsleepnet", f"{subject}.npy"),
-        dtype="float32",
-        mode="r",
-        shape=(num_windows, n_channels, 29, 129),
-    )[:]
-
-    labels = np.memmap(
-        os.path.join(data_folder, dataset_name, "labels", f"{subject}.npy"),
-        dtype="int16",
-        mode="r",
-        shape=(num_windows,),
-    )[:]
+    # the values are stored as numpy memmaps, np.array reads them into memory
+    # inside the job so that the disk reads run in parallel
+    raw = np.array(
+        np.memmap(
+            os.path.join(data_folder, dataset_name, "raw", f"{subject}.npy"),
+            dtype="float32",
+            mode="r",
+            shape=(num_windows, n_channels, 3000),
+        )
+    )
+
+    xsleep = np.array(
+        np.memmap(
+            os.path.join(data_folder, dataset_name, "xsleepnet", f"{subject}.npy"),
+            dtype="float32",
+            mode="r",
+            shape=(num_windows, n_channels, 29, 129),
+        )
+    )
+
+    labels = np.array(
+        np.memmap(
+            os.path.join(data_folder, dataset_name, "labels", f"{subject}.npy"),
+            dtype="int16",
+            mode="r",
+            shape=(num_windows,),
+        )
+    )
 
     return subject, raw, xsleep, labels
 
@@ -130,24 +148,28 @@ if __name__ == "__main__":
             file["xsleepnet"].create_dataset("std", data=data["std"], chunks=True)
 
             # read from the file the subject list
-            subject_list = list(table["subject_id"])
+            subject_list = list(zip(table["subject_id"], table["num_windows"]))
 
             batch_size = args.n_jobs
 
-            for i in tqdm(range(0, len(subject_list), batch_size)):
-                batch_subjects = subject_list[i : i + batch_size]
-                batch_indices = list(range(i, min(i + batch_size, len(subject_list))))
-                batch_num_windows = [table["num_windows"][idx] for idx in batch_indices]
-
-                results = Parallel(n_jobs=args.n_jobs)(
-                    delayed(read_subject_record)(
-                        args.data_folder, name, subject, num_windows, n_channels
+            # the jobs are i/o bound and numpy releases the gil while reading,
+            # so threads are enough; the pool is reused across batches
+            with Parallel(n_jobs=args.n_jobs, prefer="threads") as parallel:
+                for batch in tqdm(
+                    batched(subject_list, batch_size),
+                    total=math.ceil(len(subject_list) / batch_size),
+                ):
+                    results = parallel(
+                        delayed(read_subject_record)(
+                            args.data_folder, name, subject, num_windows, n_channels
+                        )
+                        for subject, num_windows in batch
                     )
-                    for subject, num_windows in zip(batch_subjects, batch_num_windows)
-                )
 
-                for subject, raw, xsleep, labels in results:
-                    # create the datasets without compression
-                    file["raw"].create_dataset(subject, data=raw, chunks=True)
-                    file["xsleepnet"].create_dataset(subject, data=xsleep, chunks=True)
-                    file["labels"].create_dataset(subject, data=labels, chunks=True)
+                    for subject, raw, xsleep, labels in results:
+                        # create the datasets without compression
+                        file["raw"].create_dataset(subject, data=raw, chunks=True)
+                        file["xsleepnet"].create_dataset(
+                            subject, data=xsleep, chunks=True
+                        )
+                        file["labels"].create_dataset(subject, data=labels, chunks=True)
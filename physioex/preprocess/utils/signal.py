@@ -1,50 +1,52 @@
 import os
+from functools import lru_cache
 
 import numpy as np
 from scipy.signal import butter, filtfilt, resample, spectrogram
 
 
-def bandpass_filter(data, lowcut, highcut, fs, order=5):
+@lru_cache(maxsize=None)
+def butter_bandpass(lowcut, highcut, fs, order=5):
+    # the filter design only depends on the band and the sampling rate,
+    # compute it once and reuse it for every record of the dataset
     nyquist = 0.5 * fs
     low = lowcut / nyquist
     high = highcut / nyquist
-    b, a = butter(order, [low, high], btype="band")
+    return butter(order, [low, high], btype="band")
+
+
+def bandpass_filter(data, lowcut, highcut, fs, order=5):
+    b, a = butter_bandpass(lowcut, highcut, fs, order)
     filtered_data = filtfilt(b, a, data)
     return filtered_data
 
 
 def xsleepnet_preprocessing(signals):
 
-    num_windows, n_channels, n_timestamps = signals.shape
-
     # transform each signal into its spectrogram ( fast )
     # nfft 256, noverlap 1, win 2, fs 100, hamming window
-
-    S = np.zeros((num_windows, n_channels, 29, 129)).astype(np.float32)
-
-    for i in range(num_windows):
-        for j in range(n_channels):
-
-            _, _, Sxx = spectrogram(
-                signals[i, j].astype(np.double).reshape(-1),
-                fs=100,
-                window="hamming",
-                nperseg=200,
-                noverlap=100,
-                nfft=256,
-            )
-
-            # log_10 scale the spectrogram safely (using epsilon)
-            Sxx = 20 * np.log10(np.abs(Sxx) + np.finfo(float).eps)
-
-            Sxx = np.transpose(Sxx, (1, 0))
-
-            S[i, j] = Sxx.astype(np.float32)
-
-    return S.astype(np.float32)
-
-
-import numpy as np
+    # the spectrogram is computed along the last axis for all the windows
+    # and channels at once instead of looping over them in python
+
+    # keep the computation in float32 (the dtype of the stored features)
+    # to avoid the float64 promotion of the whole array
+    _, _, S = spectrogram(
+        np.ascontiguousarray(signals, dtype=np.float32),
+        fs=100,
+        window="hamming",
+        nperseg=200,
+        noverlap=100,
+        nfft=256,
+        axis=-1,
+    )
+
+    # log_10 scale the spectrogram safely (using epsilon)
+    S = 20 * np.log10(np.abs(S) + np.float32(np.finfo(float).eps))
+
+    # num_windows, n_channels, 129, 29 -> num_windows, n_channels, 29, 129
+    S = np.swapaxes(S, -1, -2)
+
+    return np.ascontiguousarray(S, dtype=np.float32)
 
 
 class OnlineVariance:
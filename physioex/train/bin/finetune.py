@@ -19,6 +19,7 @@ def finetune_script():
         "task": parser["model_task"],
         "data_folder": parser["data_folder"],
         "num_workers": parser["num_workers"],
+        "prefetch_factor": parser["prefetch_factor"],
     }
 
     model = load_model(
@@ -46,6 +47,9 @@ def finetune_script():
         "resume": True,
         "monitor": parser["monitor"],
         "mode": parser["mode"],
+        "precision": parser["precision"],
+        "compile_model": parser["compile"],
+        "deterministic": parser["deterministic"],
     }
 
     best_checkpoint = finetune(
@@ -72,6 +76,8 @@ def finetune_script():
             checkpoint_path=best_checkpoint,
             results_path=parser["results_path"],
             aggregate_datasets=parser["aggregate"],
+            precision=parser["precision"],
+            deterministic=parser["deterministic"],
         )
 
 
@@ -1,3 +1,4 @@
+import copy
 import importlib
 import os
 from argparse import ArgumentParser
@@ -36,7 +37,9 @@ def parse_model(parser: dict) -> dict:
 
     model = parser["model"]
 
-    default_config = network_config["default"].copy()
+    # work on a snapshot of the registered configuration, the nested
+    # model_kwargs would otherwise be updated in place
+    default_config = copy.deepcopy(network_config["default"])
 
     if model.endswith(".yaml"):
 
@@ -44,7 +47,7 @@ def parse_model(parser: dict) -> dict:
             config = yaml.safe_load(file)
 
     elif model in network_config.keys():
-        config = network_config[model]
+        config = copy.deepcopy(network_config[model])
     else:
         raise ValueError(
             f"Model {model} not found in the registered models or not a .yaml file"
@@ -145,6 +148,14 @@ class PhysioExParser:
         help="Specify the number of workers for the dataloader. Expected type: int. Default: os.cpu_count()",
     )
 
+    parser.add_argument(
+        "--prefetch_factor",
+        "-pf",
+        type=int,
+        default=None,
+        help="Specify the number of batches loaded in advance by each dataloader worker, requires num_workers > 0. Expected type: int. Optional. Default: None",
+    )
+
     ##### Trainer arguments #####
 
     parser.add_argument(
@@ -165,9 +176,29 @@ class PhysioExParser:
     parser.add_argument(
         "--num_nodes",
         "-nn",
-        default=1,
+        default=int(os.environ.get("SLURM_NNODES", 1)),
         type=int,
-        help="Specify the number of nodes to be used for distributed training, only used when hpc is True, note: in slurm this value needs to be coherent with '--ntasks-per-node' or 'ppn' in torque. Expected type: int. Default: 1",
+        help="Specify the number of nodes to be used for distributed training, only used when hpc is True, note: in slurm this value needs to be coherent with '--ntasks-per-node' or 'ppn' in torque. Expected type: int. Default: $SLURM_NNODES if set, else 1",
+    )
+
+    parser.add_argument(
+        "--precision",
+        "-p",
+        default="bf16-mixed",
+        type=str,
+        help="Specify the numerical precision used by the trainer, e.g. '32-true', '16-mixed' or 'bf16-mixed'. Expected type: str. Default: 'bf16-mixed'",
+    )
+
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile the network with torch.compile before training. Expected type: bool. Optional. Default: False",
+    )
+
+    parser.add_argument(
+        "--deterministic",
+        action="store_true",
+        help="Use deterministic algorithms, if not set cudnn benchmarks and picks the fastest ones. Expected type: bool. Optional. Default: False",
     )
 
     parser.add_argument(
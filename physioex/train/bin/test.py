@@ -14,6 +14,7 @@ def test_script():
         "task": parser["model_task"],
         "data_folder": parser["data_folder"],
         "num_workers": parser["num_workers"],
+        "prefetch_factor": parser["prefetch_factor"],
     }
 
     test(
@@ -28,4 +29,6 @@ def test_script():
         checkpoint_path=parser["checkpoint_path"],
         results_path=parser["results_path"],
         aggregate_datasets=parser["aggregate"],
+        precision=parser["precision"],
+        deterministic=parser["deterministic"],
     )
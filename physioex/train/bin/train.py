@@ -18,6 +18,7 @@ def train_script():
         "task": parser["model_task"],
         "data_folder": parser["data_folder"],
         "num_workers": parser["num_workers"],
+        "prefetch_factor": parser["prefetch_factor"],
     }
 
     train_kwargs = {
@@ -40,6 +41,9 @@ def train_script():
         "resume": True,
         "monitor": parser["monitor"],
         "mode": parser["mode"],
+        "precision": parser["precision"],
+        "compile_model": parser["compile"],
+        "deterministic": parser["deterministic"],
     }
 
     best_checkpoint = train(**train_kwargs)
@@ -60,6 +64,8 @@ def train_script():
             checkpoint_path=best_checkpoint,
             results_path=parser["results_path"],
             aggregate_datasets=parser["aggregate"],
+            precision=parser["precision"],
+            deterministic=parser["deterministic"],
         )
 
 if __name__ == "__main__":
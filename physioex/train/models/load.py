@@ -110,8 +110,12 @@ def load_model(
     default_kwargs.update(model_kwargs)
     model_kwargs = default_kwargs
 
+    # deserialize the weights straight on the target device instead of the
+    # device they were saved from
     model = (
-        model.load_from_checkpoint(ckpt_path, module_config=model_kwargs)
+        model.load_from_checkpoint(
+            ckpt_path, map_location=device, module_config=model_kwargs
+        )
         .to(device)
         .eval()
     )
@@ -1,11 +1,24 @@
+import importlib
 import os
 
 #import pkg_resources as pkg
 import yaml
 
-from physioex.train.networks.chambon2018 import Chambon2018Net
-from physioex.train.networks.seqsleepnet import SeqSleepNet
-from physioex.train.networks.tinysleepnet import TinySleepNet
+# the networks are imported only when accessed, so that loading the
+# configuration does not import every model (and its dependencies)
+_lazy_imports = {
+    "Chambon2018Net": "physioex.train.networks.chambon2018",
+    "SeqSleepNet": "physioex.train.networks.seqsleepnet",
+    "TinySleepNet": "physioex.train.networks.tinysleepnet",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        return getattr(importlib.import_module(_lazy_imports[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 config_file = os.path.abspath( os.path.join(os.path.dirname(__file__),"config.yaml") )
 
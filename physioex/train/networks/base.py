@@ -101,8 +101,9 @@ class SleepModule(pl.LightningModule):
 
         batch_size, seq_len, n_class = outputs.size()
 
-        embeddings = embeddings.reshape(batch_size * seq_len, -1)
-        outputs = outputs.reshape(-1, n_class)
+        # compute the loss and the metrics in float32 also under mixed precision
+        embeddings = embeddings.reshape(batch_size * seq_len, -1).float()
+        outputs = outputs.reshape(-1, n_class).float()
         targets = targets.reshape(-1)
 
         if self.n_classes > 1:
@@ -12,7 +12,7 @@ from physioex.train.networks.base import SleepModule
 # that is more relevant for the classification task
 
 import seaborn as sns
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 
 class ProtoSleepNet(SleepModule):
@@ -31,13 +31,20 @@ class ProtoSleepNet(SleepModule):
         # create the heatmap of the prototypes
         # y label equal to prototype index, x label equal to the feature index
         # display the cbar with diverging colors
-        sns.heatmap(prototypes, cmap="RdPu", cbar=True)
-        plt.xlabel("Features")
-        plt.ylabel("Prototype")
-
-        plt.title("Prototypes")
-        self.logger.experiment.add_figure(f"{log}-age-corr", plt.gcf(), self.step)
-        plt.close()
+        # draw on a single figure reused across calls, outside of pyplot
+        if not hasattr(self, "figure"):
+            self.figure = Figure()
+        self.figure.clf()
+        ax = self.figure.add_subplot()
+
+        sns.heatmap(prototypes, cmap="RdPu", cbar=True, ax=ax)
+        ax.set_xlabel("Features")
+        ax.set_ylabel("Prototype")
+
+        ax.set_title("Prototypes")
+        self.logger.experiment.add_figure(
+            f"{log}-age-corr", self.figure, self.step, close=False
+        )
 
     def compute_loss(
         self,
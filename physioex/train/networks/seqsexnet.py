@@ -9,7 +9,7 @@ from physioex.train.networks.seqsleepnet import SeqSleepNet
 from physioex.train.networks.tinysleepnet import TinySleepNet
 from physioex.train.networks.base import SleepModule
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 
 
@@ -172,19 +172,27 @@ class WholeNightAgeNet(SleepModule):
 
     def log_correlation(self, outputs, targets, log: str = "train"):
 
-        plt.figure(figsize=(10, 6))
+        # draw on a single figure reused across calls, outside of pyplot
+        if not hasattr(self, "figure"):
+            self.figure = Figure(figsize=(10, 6))
+        self.figure.clf()
+        ax = self.figure.add_subplot()
+
         sns.scatterplot(
-            x=targets.view(-1).cpu().numpy(), y=outputs.view(-1).cpu().numpy()
+            x=targets.view(-1).float().cpu().numpy(),
+            y=outputs.view(-1).float().cpu().numpy(),
+            ax=ax,
         )
-        plt.xlabel("True Age")
-        plt.ylabel("Estimated Age")
-        plt.title("Correlation between Estimated and True Age")
+        ax.set_xlabel("True Age")
+        ax.set_ylabel("Estimated Age")
+        ax.set_title("Correlation between Estimated and True Age")
 
         log_id = self.train_step if log == "train" else self.val_step
 
         # convert the figure to a tensor
-        self.logger.experiment.add_figure(f"{log}-age-corr", plt.gcf(), log_id)
-        plt.close()
+        self.logger.experiment.add_figure(
+            f"{log}-age-corr", self.figure, log_id, close=False
+        )
 
     def validation_step(self, batch, batch_idx):
         # Logica di validazione
@@ -320,19 +328,27 @@ class SeqAgeNet(SleepModule):
 
     def log_correlation(self, outputs, targets, log: str = "train"):
 
-        plt.figure(figsize=(10, 6))
+        # draw on a single figure reused across calls, outside of pyplot
+        if not hasattr(self, "figure"):
+            self.figure = Figure(figsize=(10, 6))
+        self.figure.clf()
+        ax = self.figure.add_subplot()
+
         sns.scatterplot(
-            x=targets.view(-1).cpu().numpy(), y=outputs.view(-1).cpu().numpy()
+            x=targets.view(-1).float().cpu().numpy(),
+            y=outputs.view(-1).float().cpu().numpy(),
+            ax=ax,
         )
-        plt.xlabel("True Age")
-        plt.ylabel("Estimated Age")
-        plt.title("Correlation between Estimated and True Age")
+        ax.set_xlabel("True Age")
+        ax.set_ylabel("Estimated Age")
+        ax.set_title("Correlation between Estimated and True Age")
 
         log_id = self.train_step if log == "train" else self.val_step
 
         # convert the figure to a tensor
-        self.logger.experiment.add_figure(f"{log}-age-corr", plt.gcf(), log_id)
-        plt.close()
+        self.logger.experiment.add_figure(
+            f"{log}-age-corr", self.figure, log_id, close=False
+        )
 
     def validation_step(self, batch, batch_idx):
         # Logica di validazione
@@ -28,6 +28,8 @@ def test(
     results_path: str = None,
     num_nodes: int = 1,
     aggregate_datasets: bool = False,
+    precision: Union[int, str] = "32-true",
+    deterministic: bool = True,
 ) -> pd.DataFrame:
 
     seed_everything(42, workers=True)
@@ -36,33 +38,24 @@ def test(
     datamodule_kwargs["batch_size"] = batch_size
     # datamodule_kwargs["hpc"] = hpc
     datamodule_kwargs["folds"] = fold
-    datamodule_kwargs["num_nodes"] = num_nodes
+    # the datamodule shards the data across ranks only when the trainer runs distributed
+    datamodule_kwargs["num_nodes"] = num_nodes if hpc else 1
 
     ##### DataModule Setup #####
     if isinstance(datasets, PhysioExDataModule):
-        datamodule = [datasets]
+        datamodule = datasets
     elif isinstance(datasets, str):
-        datamodule = [
-            PhysioExDataModule(
-                datasets=[datasets],
-                **datamodule_kwargs,
-            )
-        ]
+        datamodule = PhysioExDataModule(
+            datasets=[datasets],
+            **datamodule_kwargs,
+        )
     elif isinstance(datasets, list):
-        if aggregate_datasets:
-            datamodule = PhysioExDataModule(
-                datasets=datasets,
-                **datamodule_kwargs,
-            )
-        else:
-            datamodule = []
-            for dataset in datasets:
-                datamodule.append(
-                    PhysioExDataModule(
-                        datasets=[dataset],
-                        **datamodule_kwargs,
-                    )
-                )
+        # a single datamodule is built for all the datasets, when they are
+        # tested separately the test split is restricted to one at a time
+        datamodule = PhysioExDataModule(
+            datasets=datasets,
+            **datamodule_kwargs,
+        )
     else:
         raise ValueError("datasets must be a list, a string or a PhysioExDataModule")
 
@@ -84,19 +77,30 @@ def test(
         strategy="ddp" if hpc and num_nodes > 1 else "auto",
         num_nodes=num_nodes if hpc else 1,
         # callbacks=[progress_bar_callback],
-        deterministic=True,
+        deterministic=deterministic,
+        # let cudnn pick the fastest algorithms when reproducibility is not required
+        benchmark=not deterministic,
+        precision=precision,
     )
+    test_datasets = [None] if aggregate_datasets else datamodule.dataset.datasets
+
     results = []
-    for _, test_datamodule in enumerate(datamodule):
-        results += [trainer.test(model, datamodule=test_datamodule)[0]]
-        results[-1]["dataset"] = (
-            test_datamodule.datasets_id[0] if not aggregate_datasets else "aggregate"
-        )
+    for i, test_dataset in enumerate(test_datasets):
+        datamodule.set_active_dataset(test_dataset)
+
+        results += [trainer.test(model, datamodule=datamodule)[0]]
+        results[-1]["dataset"] = test_dataset if test_dataset else "aggregate"
         results[-1]["fold"] = fold
 
-    results = pd.DataFrame(results)
+        # append each result to the csv as soon as it is available, so that
+        # a failure on a later dataset does not lose the previous ones
+        if results_path is not None and trainer.is_global_zero:
+            pd.DataFrame([results[-1]], index=[i]).to_csv(
+                os.path.join(results_path, "results.csv"),
+                mode="w" if i == 0 else "a",
+                header=i == 0,
+            )
 
-    if results_path is not None:
-        results.to_csv(os.path.join(results_path, "results.csv"))
+    datamodule.set_active_dataset(None)
 
-    return results
+    return pd.DataFrame(results)
@@ -10,6 +10,7 @@ from loguru import logger
 from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint, RichProgressBar, LearningRateMonitor, DeviceStatsMonitor
 from pytorch_lightning.loggers import CSVLogger, TensorBoardLogger
+from pytorch_lightning.strategies import DDPStrategy
 from torch import set_float32_matmul_precision
 
 from physioex.data import PhysioExDataModule
@@ -32,6 +33,9 @@ def train(
     resume: bool = True,
     monitor: str = "val_acc",
     mode: str = "max",
+    precision: Union[int, str] = "32-true",
+    deterministic: bool = True,
+    compile_model: bool = False,
 ) -> str:
 
     seed_everything(42, workers=True)
@@ -39,7 +43,8 @@ def train(
 
     datamodule_kwargs["batch_size"] = batch_size
     datamodule_kwargs["folds"] = fold
-    datamodule_kwargs["num_nodes"] = num_nodes
+    # the datamodule shards the data across ranks only when the trainer runs distributed
+    datamodule_kwargs["num_nodes"] = num_nodes if hpc else 1
 
     if checkpoint_path is None:
         checkpoint_path = "models/" + str(uuid.uuid4())
@@ -65,12 +70,20 @@ def train(
 
     ########### Resuming Model if needed else instantiate it ############:
     if resume and (model is None):
-        chekpoints = list(Path(checkpoint_path).glob("*.ckpt"))
+        # checkpoints of the current fold, newest first
+        chekpoints = sorted(
+            Path(checkpoint_path).glob("fold=%d-*.ckpt" % fold),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
         if len(chekpoints) > 0:
             # read the lightning_logs/version_XX/metrics.csv file
             metrics = os.listdir(os.path.join(checkpoint_path, "lightning_logs"))
-            # find the last version
-            version = sorted(metrics)[-1]
+            # find the last version, skipping anything that is not a version_N folder
+            metrics = [
+                v for v in metrics if v.startswith("version_") and v[8:].isdigit()
+            ]
+            version = max(metrics, key=lambda v: int(v[8:]))
             metrics = pd.read_csv(
                 os.path.join(checkpoint_path, "lightning_logs", version, "metrics.csv")
             )
@@ -85,13 +98,19 @@ def train(
 
             logger.info(f"Resuming training from epoch {interruption_epoch}")
 
+            # load on cpu, the trainer moves the model to the right device
             model = model_class.load_from_checkpoint(
-                chekpoints[0], module_config=model_config
+                chekpoints[0], map_location="cpu", module_config=model_config
             )
 
     if model is None:
         model = model_class(module_config=model_config)
 
+    if compile_model:
+        # the lightning steps go through nn.encode: compile it in place so that
+        # the module (and the checkpoint keys) are left untouched
+        model.nn.encode = torch.compile(model.nn.encode, dynamic=False)
+
     ########### Callbacks ############
     checkpoint_callback = ModelCheckpoint(
         monitor=monitor,
@@ -113,23 +132,32 @@ def train(
     ]
 
     ########### Trainer Setup ############
-    effective_batch_size = (
-        batch_size if not hpc else batch_size * num_nodes * torch.cuda.device_count()
+    # gradients are used as views of the allreduce buckets, saving one copy
+    # of the gradients per step
+    strategy = (
+        DDPStrategy(find_unused_parameters=False, gradient_as_bucket_view=True)
+        if hpc and num_nodes > 1
+        else "auto"
     )
-    num_steps = datamodule.dataset.__len__() * 0.7 // effective_batch_size
-    val_check_interval = max(1, num_steps // num_validations)
 
     trainer = Trainer(
         devices="auto" if not hpc else -1,
-        strategy="ddp" if hpc and num_nodes > 1 else "auto",
+        strategy=strategy,
         num_nodes=num_nodes if hpc else 1,
         max_epochs=max_epochs,
-        val_check_interval=val_check_interval,
         callbacks=[checkpoint_callback, lr_callback, dvc_callback],  # , progress_bar_callback],
-        deterministic=True,
+        deterministic=deterministic,
+        # let cudnn pick the fastest algorithms when reproducibility is not required
+        benchmark=not deterministic,
         logger=my_logger,
+        precision=precision,
     )
 
+    # each rank sees 1 / world_size of the training samples, count the steps
+    # on the devices the trainer actually uses (also without hpc)
+    num_steps = datamodule.num_train_samples // (batch_size * trainer.world_size)
+    trainer.val_check_interval = max(1, num_steps // num_validations)
+
     # setup the model in training mode if needed
     model = model.train()
     # Start training